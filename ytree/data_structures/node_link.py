@@ -19,8 +19,10 @@ class NodeLink:
     def __init__(self, tree_id):
         self.tree_id = tree_id
         self.descendent = None
-        self.ancestors = []
+        self.ancestors = None
 
     def add_ancestor(self, node):
+        if self.ancestors is None:
+            self.ancestors = []
         self.ancestors.append(node)
         node.descendent = self
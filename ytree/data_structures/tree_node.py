@@ -141,6 +141,8 @@ class TreeNode:
 
         # conventional Arbor object
         if self._link is not None:
+            if self._link.ancestors is None:
+                return
             for link in self._link.ancestors:
                 yield self.arbor._generate_tree_node(self.root, link)
             return
@@ -367,7 +369,11 @@ class TreeNode:
         if indices is None:
             raise RuntimeError("Bad selector.")
 
-        my_link = self.root._links[indices][index]
+        # Index the links once rather than selecting them all first.
+        if isinstance(indices, slice):
+            my_link = self.root._links[indices][index]
+        else:
+            my_link = self.root._links[indices[index]]
         return self.arbor._generate_tree_node(self.root, my_link)
 
     def get_leaf_nodes(self, selector=None):
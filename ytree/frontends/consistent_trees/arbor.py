@@ -81,8 +81,7 @@ class ConsistentTreesArbor(SegmentedArbor):
 
         offset = self._hoffset
         itree = 0
-        nblocks = np.ceil(float(file_size-self._hoffset) /
-                          block_size).astype(np.int64)
+        nblocks = -(-(file_size - self._hoffset) // block_size)
         for ib in range(nblocks):
             my_block = min(block_size, file_size - offset)
             if my_block <= 0: break
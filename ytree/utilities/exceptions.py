@@ -13,51 +13,80 @@ ytree exceptions
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+def _in_arbor(arbor):
+    """
+    Describe where an exception occurred, if we know.
+    """
+    if arbor is None:
+        return ""
+    return f" in {arbor}"
+
 class ArborDataFileEmpty(Exception):
+    __slots__ = ("filename",)
+
     def __init__(self, filename):
+        super().__init__(filename)
         self.filename = filename
 
     def __str__(self):
         return (f"Data file is empty: {self.filename}.")
 
 class ArborFieldException(Exception):
+    __slots__ = ("field", "arbor")
+
     def __init__(self, field, arbor=None):
+        super().__init__(field, arbor)
         self.field = field
         self.arbor = arbor
 
 class ArborFieldDependencyNotFound(Exception):
+    __slots__ = ("field", "dependency", "arbor")
+
     def __init__(self, field, dependency, arbor=None):
+        super().__init__(field, dependency, arbor)
         self.field = field
         self.dependency = dependency
         self.arbor = arbor
 
     def __str__(self):
         return (f"Field dependency not found: \"{self.dependency}\" "
-                f"(dependency for \"{self.field}\") in {self.arbor}.")
+                f"(dependency for \"{self.field}\"){_in_arbor(self.arbor)}.")
 
 class ArborFieldCircularDependency(ArborFieldException):
+    __slots__ = ()
+
     def __str__(self):
-        return f"Field depends on itself: \"{self.field}\" in {self.arbor}."
+        return f"Field depends on itself: \"{self.field}\"{_in_arbor(self.arbor)}."
 
 class ArborFieldNotFound(ArborFieldException):
+    __slots__ = ()
+
     def __str__(self):
-        return f"Field not found: \"{self.field}\" in {self.arbor}."
+        return f"Field not found: \"{self.field}\"{_in_arbor(self.arbor)}."
 
 class ArborFieldAlreadyExists(ArborFieldException):
+    __slots__ = ()
+
     def __str__(self):
-        return f"Field already exists: \"{self.field}\" in {self.arbor}."
+        return f"Field already exists: \"{self.field}\"{_in_arbor(self.arbor)}."
 
 class ArborAnalysisFieldNotGenerated(ArborFieldException):
+    __slots__ = ()
+
     def __str__(self):
         return (f"Analysis field \"{self.field}\" needed but "
-                f"not yet generated in {self.arbor}.")
+                f"not yet generated{_in_arbor(self.arbor)}.")
 
 class ArborAnalysisFieldNotFound(ArborFieldException):
+    __slots__ = ()
+
     def __str__(self):
         return (f"Analysis field \"{self.field}\" has been removed "
-                f"from arbor field storage in {self.arbor}.")
+                f"from arbor field storage{_in_arbor(self.arbor)}.")
 
 class ArborUnsettableField(ArborFieldException):
+    __slots__ = ()
+
     def __str__(self):
-        return (f"Cannot set values for field \"{self.field}\" in {self.arbor}. "
+        return (f"Cannot set values for field \"{self.field}\"{_in_arbor(self.arbor)}. "
                 "Only analysis fields can be set.")
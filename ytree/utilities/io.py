@@ -13,7 +13,6 @@ io utilities
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
-import errno
 import numpy as np
 import os
 from unyt import \
@@ -38,16 +37,7 @@ def dirname(path, level=1):
 
 def ensure_dir(path):
     r"""Parallel safe directory maker."""
-    if os.path.exists(path):
-        return path
-
-    try:
-        os.makedirs(path)
-    except OSError as e:
-        if e.errno == errno.EEXIST:
-            pass
-        else:
-            raise
+    os.makedirs(path, exist_ok=True)
     return path
 
 def parse_h5_attr(f, attr):
@@ -70,12 +60,9 @@ def _hdf5_yt_attr(fh, attr, unit_registry=None):
     as either a unyt_array or unyt_quantity.
     """
     val = fh.attrs[attr]
-    units = ""
-    ufield = f"{attr}_units"
-    if ufield in fh.attrs:
-        units = fh.attrs[ufield]
-        if isinstance(units, bytes):
-            units = units.decode("utf")
+    units = fh.attrs.get(f"{attr}_units", "")
+    if isinstance(units, bytes):
+        units = units.decode("utf-8")
     if units == "dimensionless":
         units = ""
     if units != "":
@@ -90,13 +77,12 @@ def _hdf5_yt_array_lite(fh, field):
     Read an hdf5 dataset.  If that dataset has a "units" attribute,
     return that as well, but do not cast as a unyt_array.
     """
-    units = ""
-    if "units" in fh[field].attrs:
-        units = fh[field].attrs["units"]
+    dset = fh[field]
+    units = dset.attrs.get("units", "")
     if units == "dimensionless": units = ""
-    return (fh[field][()], units)
+    return (dset[()], units)
 
-def f_text_block(f, block_size=4096, file_size=None, sep="\n",
+def f_text_block(f, block_size=65536, file_size=None, sep="\n",
                  pbar_string=None):
     """
     Read lines from a file faster than f.readlines().
@@ -107,8 +93,7 @@ def f_text_block(f, block_size=4096, file_size=None, sep="\n",
         file_size = f.tell() - start
         f.seek(start)
 
-    nblocks = np.ceil(float(file_size) /
-                      block_size).astype(np.int64)
+    nblocks = -(-file_size // block_size)
     read_size = file_size + start
     lbuff = ""
     if pbar_string is None:
@@ -120,20 +105,18 @@ def f_text_block(f, block_size=4096, file_size=None, sep="\n",
         my_block = min(block_size, read_size-offset)
         if my_block <= 0: break
         buff = f.read(my_block)
-        linl = -1
-        for ih in range(buff.count(sep)):
-            inl = buff.find(sep, linl+1)
-            if inl < 0:
-                lbuff += buff[linl+1:]
-                continue
-            else:
-                line = lbuff + buff[linl+1:inl]
-                loc = offset - len(lbuff) + linl + 1
-                lbuff = ""
-                linl = inl
-                pbar.update(loc+len(line)-start+1)
-                yield line, loc
-        lbuff += buff[linl+1:]
+        # All but the last piece are complete lines. The last
+        # piece is carried over to the next block.
+        lines = buff.split(sep)
+        loc = offset - len(lbuff)
+        lines[0] = lbuff + lines[0]
+        lbuff = lines.pop()
+        for line in lines:
+            yield line, loc
+            loc += len(line) + len(sep)
+        # Update progress once per block rather than once per line.
+        if lines:
+            pbar.update(loc-start)
     if lbuff:
         loc = f.tell() - len(lbuff)
         pbar.update(loc+len(lbuff)-start+1)
@@ -13,8 +13,6 @@ parallel utilities
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
-import numpy as np
-
 from yt.funcs import is_root
 from yt.utilities.parallel_tools.parallel_analysis_interface import \
     _get_comm, \
@@ -133,7 +131,18 @@ def parallel_trees(trees, save_every=None, save_in_place=None,
     elif save_every is False:
         save_every = nt
         save = False
-    nb = int(np.ceil(nt / save_every))
+    nb = -(-nt // save_every)
+
+    # With nothing to collect or save, just hand out the trees.
+    if not save and not afields:
+        for itree in parallel_objects(
+                range(nt), njobs=njobs, dynamic=dynamic):
+            yield trees[itree]
+        return
+
+    # Results for trees done on this process are already in place
+    # if this is where they will be combined.
+    combine_here = is_root()
 
     for ib in range(nb):
         start = ib * save_every
@@ -151,6 +160,10 @@ def parallel_trees(trees, save_every=None, save_in_place=None,
                 my_root = my_tree.find_root()
                 tree_store.result_id = (my_root._arbor_index, my_tree.tree_id)
 
+                if combine_here:
+                    tree_store.result = None
+                    continue
+
                 # If the tree is not a root, only save the "tree" selection
                 # as we could overwrite other trees in the forest.
                 if save_roots_only:
@@ -177,13 +190,15 @@ def parallel_trees(trees, save_every=None, save_in_place=None,
                 my_root = my_tree.find_root()
                 key = (my_root._arbor_index, my_tree.tree_id)
                 data = arbor_storage[key]
+                if data is None:
+                    continue
 
                 if save_roots_only:
                     indices = my_tree.tree_id
                 elif my_tree.is_root:
                     indices = slice(None)
                 else:
-                    indices = [my_tree._tree_field_indices]
+                    indices = my_tree._tree_field_indices
 
                 for field in afields:
                     if field not in my_root.field_data:
@@ -283,14 +298,19 @@ def parallel_tree_nodes(tree, group="forest",
 
     afields = tree.arbor.analysis_field_list
 
-    my_halos = list(tree[group])
+    # Count the nodes without creating them. Each process will only
+    # create the nodes it is given.
+    if group == "forest":
+        nhalos = tree.find_root().tree_size
+    else:
+        nhalos = getattr(tree, f"_{group}_field_indices").size
 
     tree_storage = {}
     for halo_store, ihalo in parallel_objects(
-            range(len(my_halos)), storage=tree_storage,
+            range(nhalos), storage=tree_storage,
             njobs=njobs, dynamic=dynamic):
 
-        my_halo = my_halos[ihalo]
+        my_halo = tree.get_node(group, ihalo)
         yield my_halo
         if is_root():
             halo_store.result_id = my_halo.tree_id
@@ -301,13 +321,31 @@ def parallel_tree_nodes(tree, group="forest",
 
     # combine results for this tree
     if is_root():
-        for tree_id, result in sorted(tree_storage.items()):
-            if tree_id == -1:
-                continue
-            my_halo = tree.get_node("forest", tree_id)
-
-            for field, value in result.items():
-                my_halo[field] = value
+        tree_storage.pop(-1, None)
+        my_root = tree.find_root()
+
+        # Setting values for the root node also updates the
+        # arbor's root field arrays, so leave that to the node.
+        root_result = tree_storage.pop(0, None)
+        if root_result is not None:
+            for field, value in root_result.items():
+                my_root[field] = value
+
+        if not tree_storage:
+            return
+
+        # Write all other nodes with one assignment per field.
+        arbor = tree.arbor
+        arbor._node_io.get_fields(my_root, fields=afields, root_only=False)
+        tree_ids = list(tree_storage.keys())
+        for field in afields:
+            values = arbor.arr([tree_storage[tree_id][field]
+                                for tree_id in tree_ids])
+            my_root.field_data[field][tree_ids] = values
+
+            vector_fieldname = arbor.field_info[field].get("vector_fieldname")
+            if vector_fieldname is not None:
+                my_root.field_data.pop(vector_fieldname, None)
 
 def parallel_nodes(trees, group="forest", save_every=None,
                    save_in_place=None, filename=None,
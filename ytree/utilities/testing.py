@@ -214,14 +214,14 @@ class ArborTest:
         verify_get_leaf_nodes(my_tree)
 
     def test_get_node(self):
+        rng = np.random.default_rng(47988)
         for my_tree in get_random_trees(self.arbor, 47988, 5):
-            verify_get_node(my_tree)
+            verify_get_node(my_tree, rng=rng)
 
-            ihalos = np.arange(1, my_tree.tree_size)
-            np.random.shuffle(ihalos)
+            ihalos = rng.permutation(np.arange(1, my_tree.tree_size))
             for ihalo in ihalos[:3]:
                 my_halo = my_tree.get_node("forest", ihalo)
-                verify_get_node(my_halo)
+                verify_get_node(my_halo, rng=rng)
 
     def test_get_node_ungrown_nonroot(self):
         my_tree = list(self.arbor[0].ancestors)[0]
@@ -231,7 +231,7 @@ class ArborTest:
 
     def test_reset_node(self):
         t = self.arbor[0]
-        ts0 = len(list(t['tree']))
+        ts0 = sum(1 for _ in t['tree'])
         f0 = dict((field, t['tree', field])
                   for field in ['uid', 'desc_uid'])
 
@@ -247,7 +247,7 @@ class ArborTest:
         assert not self.arbor.is_grown(t)
 
         assert_equal(
-            len(list(t['tree'])), ts0,
+            sum(1 for _ in t['tree']), ts0,
             err_msg=f'Trees are not the same size after resetting for {self.arbor}.')
 
         for field in f0:
@@ -258,14 +258,14 @@ class ArborTest:
     def test_reset_nonroot(self):
         t = self.arbor[0]
         node = list(t['tree'])[1]
-        ts0 = len(list(node['tree']))
+        ts0 = sum(1 for _ in node['tree'])
         f0 = dict((field, node['tree', field])
                   for field in ['uid', 'desc_uid'])
 
         self.arbor.reset_node(node)
 
         assert_equal(
-            len(list(node['tree'])), ts0,
+            sum(1 for _ in node['tree']), ts0,
             err_msg=f'Trees are not the same size after resetting for {self.arbor}.')
 
         for field in f0:
@@ -282,24 +282,29 @@ class ArborTest:
         for field in a.field_info.vector_fields:
 
             mylog.info(f"Comparing vector field: {field}.")
-            magfield = np.sqrt((a[field]**2).sum(axis=1))
+            a_field = a[field]
+            t_field = t[field]
+            t_group_fields = {group: t[group, field]
+                              for group in ["prog", "tree"]}
+
+            magfield = np.sqrt((a_field**2).sum(axis=1))
             assert_array_equal(a[f"{field}_magnitude"], magfield,
                                err_msg=f"Magnitude field incorrect: {field}.")
 
             for i, ax in enumerate("xyz"):
                 assert_array_equal(
-                    a[f"{field}_{ax}"], a[field][:, i],
+                    a[f"{field}_{ax}"], a_field[:, i],
                     err_msg=(f"Arbor vector field {field} does not match "
                              f"in dimension {i}."))
 
                 assert_array_equal(
-                    t[f"{field}_{ax}"], t[field][i],
+                    t[f"{field}_{ax}"], t_field[i],
                     err_msg=(f"Tree vector field {field} does not match "
                              f"in dimension {i}."))
 
-                for group in ["prog", "tree"]:
+                for group, t_group_field in t_group_fields.items():
                     assert_array_equal(
-                        t[group, f"{field}_{ax}"], t[group, field][:, i],
+                        t[group, f"{field}_{ax}"], t_group_field[:, i],
                         err_msg=(f"{group} vector field {field} does not match "
                                  f"in dimension {i}."))
 
@@ -323,11 +328,10 @@ def get_random_trees(arbor, seed, n):
     Get n random trees from the arbor.
     """
 
-    np.random.seed(seed)
-    itrees = np.arange(arbor.size)
-    np.random.shuffle(itrees)
-    for itree in itrees[:5]:
-        yield arbor[itree]
+    rng = np.random.default_rng(seed)
+    itrees = rng.choice(arbor.size, size=min(n, arbor.size), replace=False)
+    for itree in itrees:
+        yield arbor[int(itree)]
 
 def save_and_compare(arbor, skip=1, groups=None):
     """
@@ -344,6 +348,23 @@ def save_and_compare(arbor, skip=1, groups=None):
     assert isinstance(save_arbor, YTreeArbor)
     compare_arbors(save_arbor, arbor, groups=groups, skip2=skip)
 
+def _array_equal(a1, a2):
+    """
+    Quick check for exactly equal arrays, counting NaNs as equal.
+    """
+
+    equal_nan = np.asarray(a1).dtype.kind in "fc"
+    return np.array_equal(a1, a2, equal_nan=equal_nan)
+
+def _assert_array_equal(a1, a2, err_msg=""):
+    """
+    Run assert_array_equal only if a quick check finds a difference.
+    """
+
+    if _array_equal(a1, a2):
+        return
+    assert_array_equal(a1, a2, err_msg=err_msg)
+
 def compare_arbors(a1, a2, groups=None, fields=None, skip1=1, skip2=1):
     """
     Compare all fields for all trees in two arbors.
@@ -357,15 +378,14 @@ def compare_arbors(a1, a2, groups=None, fields=None, skip1=1, skip2=1):
 
     for i, field in enumerate(fields):
         mylog.info(f"Comparing arbor field: {field} ({i+1}/{len(fields)}).")
-        assert_array_equal(a1[field][::skip1], a2[field][::skip2],
-                           err_msg=f"Arbor field mismatch: {a1, a2, field}.")
-
-    trees1 = list(a1[::skip1])
-    trees2 = list(a2[::skip2])
+        _assert_array_equal(a1[field][::skip1], a2[field][::skip2],
+                            err_msg=f"Arbor field mismatch: {a1, a2, field}.")
 
-    ntot = len(trees1)
+    # Slicing an arbor yields one tree at a time, so only
+    # the pair being compared needs to be in memory.
+    ntot = len(range(a1.size)[::skip1])
     pbar = get_pbar("Comparing trees", ntot)
-    for i, (t1, t2) in enumerate(zip(trees1, trees2)):
+    for i, (t1, t2) in enumerate(zip(a1[::skip1], a2[::skip2])):
         compare_trees(t1, t2, groups=groups, fields=fields)
         pbar.update(i+1)
     pbar.finish()
@@ -383,7 +403,7 @@ def compare_trees(t1, t2, groups=None, fields=None):
 
     for field in fields:
         for group in groups:
-            assert_array_equal(
+            _assert_array_equal(
                 t1[group, field], t2[group, field],
                 err_msg=f"Tree comparison failed for {group} field: {field}.")
     t1.arbor.reset_node(t1)
@@ -407,34 +427,42 @@ def compare_hdf5(fh1, fh2, compare=None, compare_groups=True,
         assert_equal(sorted(list(fh1.keys())), sorted(list(fh2.keys())), err_msg=err_msg)
 
     for key in fh1.keys():
-        if isinstance(fh1[key], h5py.Group):
-            compare_hdf5(fh1[key], fh2[key],
+        d1 = fh1[key]
+        d2 = fh2[key]
+        if isinstance(d1, h5py.Group):
+            compare_hdf5(d1, d2,
                          compare_groups=compare_groups,
                          compare=compare, **kwargs)
         else:
+            v1 = d1[()]
+            v2 = d2[()]
+            # Exactly equal data passes any comparison.
+            if _array_equal(v1, v2):
+                continue
+
             err_msg = f"{key} field not equal for {fh1.file.filename} and {fh2.file.filename}"
-            if fh1[key].dtype == "int":
-                assert_array_equal(fh1[key][()], fh2[key][()],
-                                   err_msg=err_msg)
+            if d1.dtype == "int":
+                assert_array_equal(v1, v2, err_msg=err_msg)
             else:
-                compare(fh1[key][()], fh2[key][()],
-                        err_msg=err_msg, **kwargs)
+                compare(v1, v2, err_msg=err_msg, **kwargs)
 
 def assert_rel_equal(a1, a2, decimals, err_msg="", verbose=True):
     # We have nan checks in here because occasionally we have fields that get
     # weighted without non-zero weights.  I'm looking at you, particle fields!
     if isinstance(a1, np.ndarray):
         assert a1.size == a2.size
+        a1 = np.asarray(a1)
+        a2 = np.asarray(a2)
         # Mask out NaNs
-        assert (np.isnan(a1) == np.isnan(a2)).all()
-        a1[np.isnan(a1)] = 1.0
-        a2[np.isnan(a2)] = 1.0
+        nan1 = np.isnan(a1)
+        assert (nan1 == np.isnan(a2)).all()
         # Mask out 0
-        ind1 = np.array(np.abs(a1) < np.finfo(a1.dtype).eps)
-        ind2 = np.array(np.abs(a2) < np.finfo(a2.dtype).eps)
-        assert (ind1 == ind2).all()
-        a1[ind1] = 1.0
-        a2[ind2] = 1.0
+        ind1 = np.abs(a1) < np.finfo(a1.dtype).eps
+        assert (ind1 == (np.abs(a2) < np.finfo(a2.dtype).eps)).all()
+        # Replace masked values in copies, leaving the inputs alone.
+        mask = nan1 | ind1
+        a1 = np.where(mask, 1.0, a1)
+        a2 = np.where(mask, 1.0, a2)
     elif np.any(np.isnan(a1)) and np.any(np.isnan(a2)):
         return True
     if not isinstance(a1, np.ndarray) and a1 == a2 == 0.0:
@@ -450,17 +478,19 @@ def assert_array_rel_equal(a1, a2, decimals=16, **kwargs):
     """
     assert_rel_equal(a1, a2, decimals, **kwargs)
 
-def verify_get_node(my_tree, n=3):
+def verify_get_node(my_tree, n=3, rng=None):
     """
     Unit tests for get_node.
     """
+    if rng is None:
+        rng = np.random.default_rng()
+
     for selector in ["forest", "tree", "prog"]:
         node_list = list(my_tree[selector])
 
-        inodes = np.arange(len(node_list))
-        np.random.shuffle(inodes)
+        inodes = rng.permutation(len(node_list))
 
-        for inode in inodes[:3]:
+        for inode in inodes[:n]:
             my_node = my_tree.get_node(selector, inode)
             err_msg = f"get_node failed: {selector} " + \
               f"with {str(my_tree.arbor)}."
@@ -188,63 +188,95 @@ class TreePlot:
 
     def _plot(self):
         self.graph = pydot.Dot(graph_type='graph', **self.dot_kwargs)
+        # pydot nodes already added to the graph, keyed by uid
+        self._nodes = {}
+        self._filtered_uids = self._get_filtered_uids()
+        if self.node_function is None:
+            # Main progenitors are colored differently. Get them
+            # once for fast membership checks while plotting.
+            prog_uids = self.tree.find_root()['prog', 'uid']
+            self._prog_uids = set(np.asarray(prog_uids).tolist())
+            self._node_sizes = self._size_norm()
         self._plot_ancestors(self.tree)
 
     def _plot_ancestors(self, halo):
         graph = self.graph
 
+        # Walk the tree depth-first with a stack instead of recursing,
+        # so very deep trees do not hit the recursion limit. Nodes and
+        # edges are added in the same order as a recursive walk.
         my_node = self._plot_node(halo)
-        ancestors = list(halo.ancestors)
-        if ancestors is None:
-            return
-
-        for anc in ancestors:
-            if self.min_mass is not None and \
-              anc['mass'] < self.min_mass:
-                continue
-            if self.min_mass_ratio is not None and \
-              anc['mass'] / anc.root['mass'] < self.min_mass_ratio:
-                continue
-
-            anc_node = self._plot_node(anc)
-
-            if self.edge_function is not None:
-                edge_kwargs = self.edge_function(anc, halo)
+        stack = [(halo, my_node, iter(list(halo.ancestors)))]
+        while stack:
+            halo, my_node, ancestors = stack[-1]
+            for anc in ancestors:
+                if anc.uid in self._filtered_uids:
+                    continue
+
+                anc_node = self._plot_node(anc)
+
+                if self.edge_function is not None:
+                    edge_kwargs = self.edge_function(anc, halo)
+                else:
+                    edge_kwargs = {"penwidth": 5}
+
+                graph.add_edge(pydot.Edge(my_node, anc_node, **edge_kwargs))
+                stack.append((anc, anc_node, iter(list(anc.ancestors))))
+                break
             else:
-                edge_kwargs = {"penwidth": 5}
+                stack.pop()
+
+    def _get_filtered_uids(self):
+        """
+        Get uids of all halos excluded by the mass filters.
+        """
 
-            graph.add_edge(pydot.Edge(my_node, anc_node, **edge_kwargs))
-            self._plot_ancestors(anc)
+        if self.min_mass is None and self.min_mass_ratio is None:
+            return set()
+
+        masses = self.tree['tree', 'mass']
+        exclude = np.zeros(masses.size, dtype=bool)
+        if self.min_mass is not None:
+            # Convert the limit, not the masses, to avoid overflowing
+            # single precision fields.
+            exclude |= masses < self.min_mass.to(masses.units)
+        if self.min_mass_ratio is not None:
+            root_mass = self.tree.find_root()['mass']
+            exclude |= masses / root_mass < self.min_mass_ratio
+
+        uids = np.asarray(self.tree['tree', 'uid'])
+        return set(uids[exclude].tolist())
 
     def _plot_node(self, halo):
         graph = self.graph
-        node_name = f"{halo.uid}"
-        my_node = graph.get_node(node_name)
+        my_node = self._nodes.get(halo.uid)
 
-        if len(my_node) == 0:
+        if my_node is None:
             if self.node_function is not None:
                 node_kwargs = self.node_function(halo)
 
             else:
-                prog_ids = halo.find_root()['prog', 'uid']
-                if halo['uid'] in prog_ids:
+                if halo.uid in self._prog_uids:
                     color = 'red'
                 else:
                     color = 'black'
                 node_kwargs = \
                   {'style': 'filled', 'label': '', 'fillcolor': color,
                    'shape': 'circle', 'fixedsized': 'true',
-                   'width': self._size_norm(halo)}
+                   'width': self._node_sizes[halo.uid]}
 
             my_node = pydot.Node(
-                node_name, **node_kwargs)
+                f"{halo.uid}", **node_kwargs)
             graph.add_node(my_node)
-        else:
-            my_node = my_node[0]
+            self._nodes[halo.uid] = my_node
 
         return my_node
 
-    def _size_norm(self, halo):
+    def _size_norm(self):
+        """
+        Get circle sizes for all nodes in the tree, keyed by uid.
+        """
+
         if self._min_field_size is None:
             tdata = self.tree['tree', self.size_field]
             if self.size_log:
@@ -258,16 +290,18 @@ class TreePlot:
             self._max_field_size = tdata.max()
         nmax = self._max_field_size
 
-        fval = halo[self.size_field]
-        if self.size_log:
-            val = np.log(fval / nmin) / np.log(nmax / nmin)
-        else:
-            val = (fval - nmin) / (nmax - nmin)
-        val = np.clip(float(val), 0, 1)
+        fval = self.tree['tree', self.size_field]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self.size_log:
+                val = np.log(fval / nmin) / np.log(nmax / nmin)
+            else:
+                val = (fval - nmin) / (nmax - nmin)
+        val = np.clip(np.asarray(val, dtype=float), 0, 1)
 
         size = val * (self._max_dot_size - self._min_dot_size) + \
           self._min_dot_size
-        return size
+        uids = np.asarray(self.tree['tree', 'uid'])
+        return dict(zip(uids.tolist(), size.tolist()))
 
     @property
     def min_mass(self):
@@ -54,6 +54,18 @@ class YTreeHDF5File(ParticleFile):
     def analysis_filename(self):
         return f"{self._prefix}-analysis{self.ds._suffix}"
 
+    _tree_start_index = None
+    def _get_tree_start_index(self, f):
+        """
+        Return the index of the first node of each tree in this file.
+
+        This is read once and kept, as it does not change.
+        """
+
+        if self._tree_start_index is None:
+            self._tree_start_index = f["index/tree_start_index"][()]
+        return self._tree_start_index
+
     def _read_data(self, f, fname, mask):
         si = self.start
         ei = self.end
@@ -68,8 +80,8 @@ class YTreeHDF5File(ParticleFile):
         """
 
         indices = np.arange(self.start, self.end)[mask]
-        tree_start = f["index/tree_start_index"][()]
-        return np.digitize(indices, tree_start) - 1
+        tree_start = self._get_tree_start_index(f)
+        return np.searchsorted(tree_start, indices, side="right") - 1
 
     def _get_file_number(self, mask):
         """
@@ -78,7 +90,11 @@ class YTreeHDF5File(ParticleFile):
         We use this to find the index of the root node in the arbor.
         """
 
-        return np.full(self.end-self.start, self._file_number)[mask]
+        if isinstance(mask, slice):
+            size = len(range(self.start, self.end)[mask])
+        else:
+            size = np.count_nonzero(mask)
+        return np.full(size, self._file_number)
 
     def _get_tree_index(self, f, mask):
         """
@@ -88,22 +104,22 @@ class YTreeHDF5File(ParticleFile):
         """
 
         indices = np.arange(self.start, self.end)[mask]
-        tree_start = f["index/tree_start_index"][()]
-        root_index = np.digitize(indices, tree_start) - 1
+        tree_start = self._get_tree_start_index(f)
+        root_index = np.searchsorted(tree_start, indices, side="right") - 1
         return indices - tree_start[root_index]
 
-    def _read_field_data(self, field, mask, f=None):
-        if f is None:
-            close = True
-            f = h5py.File(self.filename, mode="r")
-        else:
-            close = False
-
-        if self.ds._field_dict.get(field, {}).get("source") == "analysis":
-            my_f = h5py.File(self.analysis_filename, mode="r")
-            close = True
+    def _read_field_data(self, field, mask, f=None, analysis_f=None):
+        if field in self.ds._analysis_fields:
+            my_f = analysis_f
+            filename = self.analysis_filename
         else:
             my_f = f
+            filename = self.filename
+
+        # Only close the file if it was opened here.
+        close = my_f is None
+        if close:
+            my_f = h5py.File(filename, mode="r")
 
         if field == "file_root_index":
             data = self._get_file_root_index(my_f, mask)
@@ -128,10 +144,15 @@ class YTreeHDF5File(ParticleFile):
 
         mask = slice(None)
         pn = "data/position_%s"
-        with h5py.File(self.filename, mode="r") as f:
-            units = parse_h5_attr(f[pn % "x"], "units")
-            pos = np.vstack(
-                [self._read_data(f, pn % ax, mask).astype("float64") for ax in "xyz"]).T
+        units = parse_h5_attr(f[pn % "x"], "units")
+        # Fill one float64 buffer rather than stacking converted copies.
+        pos = None
+        for i, ax in enumerate("xyz"):
+            data = self._read_data(f, pn % ax, mask)
+            if pos is None:
+                pos = np.empty((3, data.size), dtype="float64")
+            pos[i] = data
+        pos = pos.T
 
         if close:
             f.close()
@@ -155,6 +176,7 @@ class YTreeDataset(SavedDataset):
     _suffix = ".h5"
     _con_attrs = ("hubble_constant", "omega_matter", "omega_lambda")
     _force_periodicity = True
+    _analysis_fields = frozenset()
 
     def __init__(self, filename, dataset_type="ytree_arbor",
                  index_order=None,
@@ -176,6 +198,7 @@ class YTreeDataset(SavedDataset):
         for fi in afd.values():
             fi["source"] = "analysis"
         self._field_dict.update(afd)
+        self._analysis_fields = frozenset(afd)
 
     def _set_derived_attrs(self):
         self.domain_center = 0.5 * (self.domain_right_edge +
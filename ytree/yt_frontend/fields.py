@@ -22,7 +22,9 @@ v_units = 'km/s'
 
 def _redshift(field, data):
     ptype, _ = field.name
-    return 1. / data[ptype, 'scale_factor'] - 1
+    z = 1. / data[ptype, 'scale_factor']
+    z -= 1
+    return z
 
 def _time(field, data):
     ptype, _ = field.name
@@ -15,6 +15,7 @@ ytree io
 #-----------------------------------------------------------------------------
 
 import h5py
+from itertools import chain
 from more_itertools import always_iterable
 import numpy as np
 
@@ -34,26 +35,41 @@ class IOHandlerYTreeHDF5(BaseIOHandler):
             yield _ptype, (x, y, z), 0.0
 
     def _read_particle_fields(self, chunks, ptf, selector):
+        # Open the analysis file once per data file if any fields need it.
+        read_analysis = any(field in self.ds._analysis_fields
+                            for field_list in ptf.values()
+                            for field in field_list)
+        sorted_ptf = sorted(ptf.items())
+
         for data_file in self._yield_data_files(chunks):
             with h5py.File(data_file.filename, "r") as f:
-                for ptype, field_list in sorted(ptf.items()):
-                    x, y, z = data_file._get_particle_positions(ptype, f=f)
-                    mask = selector.select_points(x, y, z, 0.0)
-                    del x, y, z
-                    if mask is None:
-                        continue
-                    if mask.all():
-                        mask = slice(None)
-                    for field in field_list:
-                        data = data_file._read_field_data(field, mask, f=f)
-                        yield (ptype, field), data
+                if read_analysis:
+                    analysis_f = h5py.File(data_file.analysis_filename, "r")
+                else:
+                    analysis_f = None
+
+                try:
+                    for ptype, field_list in sorted_ptf:
+                        x, y, z = data_file._get_particle_positions(ptype, f=f)
+                        mask = selector.select_points(x, y, z, 0.0)
+                        del x, y, z
+                        if mask is None:
+                            continue
+                        if mask.all():
+                            mask = slice(None)
+                        for field in field_list:
+                            data = data_file._read_field_data(
+                                field, mask, f=f, analysis_f=analysis_f)
+                            yield (ptype, field), data
+                finally:
+                    if analysis_f is not None:
+                        analysis_f.close()
 
     def _yield_data_files(self, chunks):
-        chunks = always_iterable(chunks)
-        data_files = set([])
-        for chunk in chunks:
-            for obj in chunk.objs:
-                data_files.update(obj.data_files)
+        data_files = set(chain.from_iterable(
+            obj.data_files
+            for chunk in always_iterable(chunks)
+            for obj in chunk.objs))
 
         for data_file in sorted(data_files):
             yield data_file